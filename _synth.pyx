@@ -0,0 +1,65 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Ahead-of-time compiled versions of sauce.py's numba kernels.
+
+Build in place with ``python setup.py build_ext --inplace``. sauce.py picks
+these up when the extension is importable and otherwise JIT-compiles its own.
+"""
+from cython.parallel import prange
+from libc.stdint cimport uint32_t, int16_t
+
+# The phase accumulators are uint32_t, which is what lets them wrap for free.
+# sauce.py checks this against its own PHASE_BITS before using these kernels
+cdef int _PHASE_BITS = 8 * sizeof(uint32_t)
+PHASE_BITS = _PHASE_BITS
+
+
+def _two_osc(float[::1] mono, uint32_t step1, uint32_t step2, const float[::1] lut):
+    """Mix two linearly interpolated wavetable oscillators into mono in a single pass."""
+    cdef Py_ssize_t n = mono.shape[0], i
+    cdef int table_bits = 0
+    while (1 << table_bits) < lut.shape[0] - 1:
+        table_bits += 1
+    cdef int shift = _PHASE_BITS - table_bits
+    cdef uint32_t frac_mask = (1u << shift) - 1
+    cdef float frac_scale = 1.0 / (1u << shift)
+    cdef uint32_t p1, p2, i1, i2
+    cdef float f1, f2, s1, s2
+    for i in prange(n, schedule="static", nogil=True):
+        # uint32_t arithmetic wraps the phase for free
+        p1 = <uint32_t>i * step1
+        p2 = <uint32_t>i * step2
+        i1 = p1 >> shift
+        i2 = p2 >> shift
+        f1 = (p1 & frac_mask) * frac_scale
+        f2 = (p2 & frac_mask) * frac_scale
+        s1 = lut[i1] + (lut[i1 + 1] - lut[i1]) * f1
+        s2 = lut[i2] + (lut[i2 + 1] - lut[i2]) * f2
+        mono[i] = <float>0.5 * (s1 + s2)
+
+
+def _finalize(const float[::1] mono, double left_vol, double right_vol, int16_t[:, ::1] out):
+    """Scale, clip and pan mono samples into int16 stereo in a single pass."""
+    cdef Py_ssize_t n = mono.shape[0], i
+    cdef double x
+    for i in prange(n, schedule="static", nogil=True):
+        x = min(max(mono[i] * 32767.0, -32768.0), 32767.0)
+        out[i, 0] = <int16_t>(x * left_vol)
+        out[i, 1] = <int16_t>(x * right_vol)
+
+
+def _envelope_kernel(float[::1] env, Py_ssize_t a_n, Py_ssize_t d_n, double s_lvl, Py_ssize_t r_n):
+    """Fill env with the squared ADSR envelope."""
+    cdef Py_ssize_t total = env.shape[0], i
+    cdef Py_ssize_t s_n = max(total - (a_n + d_n + r_n), 0)
+    cdef double level
+    for i in prange(total, schedule="static", nogil=True):
+        # Same segments as the numba kernel in sauce.py
+        if i < a_n:
+            level = <double>i / (a_n - 1) if a_n > 1 else 0.0
+        elif i < a_n + d_n:
+            level = 1.0 + (s_lvl - 1.0) * (i - a_n) / (d_n - 1) if d_n > 1 else 1.0
+        elif i < a_n + d_n + s_n:
+            level = s_lvl
+        else:
+            level = s_lvl - s_lvl * (i - a_n - d_n - s_n) / (r_n - 1) if r_n > 1 else s_lvl
+        env[i] = <float>(level * level)
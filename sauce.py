@@ -4,7 +4,10 @@ import pygame
 import threading
 import time
 import numpy as np
+from scipy import signal
+from numba import njit, prange
 import json
+import functools
 
 # Initialize Pygame Mixer
 pygame.mixer.init(frequency=44100, size=-16, channels=2)
@@ -15,45 +18,147 @@ DURATION = 0.5
 NUM_VOICES = 4
 NUM_BANDS = 6
 STEP_COUNT = 32
+MIX_AHEAD = 2 * SAMPLE_RATE  # sequencer mix buffer: longest note plus the slowest step
+RENDER_DEBOUNCE_MS = 150  # re-render a voice once its controls have been still this long
+
+# Sine wavetable; the size is a power of two so the phase wraps with a mask,
+# plus one guard entry so interpolation can always read idx + 1
+SINE_TABLE_BITS = 12
+SINE_TABLE_SIZE = 1 << SINE_TABLE_BITS
+SINE_LUT = np.sin(2 * np.pi * np.arange(SINE_TABLE_SIZE + 1) / SINE_TABLE_SIZE).astype(np.float32)
+PHASE_BITS = 32
+
+# Peaking EQ bands, log-spaced across the audible range
+EQ_CENTERS = np.geomspace(60, 16000, NUM_BANDS)
+EQ_Q = 0.86  # roughly one band spacing (1.6 octaves) wide
+EQ_FLOOR = 1e-3  # -60 dB, a zeroed band still has a finite gain
+# The parts of each band's coefficients that don't depend on its gain
+EQ_COS_W0 = np.cos(2 * np.pi * EQ_CENTERS / SAMPLE_RATE)
+EQ_ALPHA = np.sin(2 * np.pi * EQ_CENTERS / SAMPLE_RATE) / (2 * EQ_Q)
+
+# One record per voice, mirrored from its controls; float64 like the Tk
+# variables so saved patterns round-trip exactly
+VOICE_DTYPE = np.dtype([
+    ("A", "f8"), ("D", "f8"), ("S", "f8"), ("R", "f8"),
+    ("P1", "f8"), ("P2", "f8"), ("V", "f8"), ("G", "f8"), ("Loop", "i4"),
+    ("eq", "f8", NUM_BANDS), ("distortion", "f8"), ("left_vol", "f8"), ("right_vol", "f8"),
+])
+
+
+@functools.lru_cache(maxsize=64)
+def eq_sos(eq_values):
+    """Build a peaking biquad per band as a second-order-sections array."""
+    amp = np.sqrt(np.maximum(eq_values, EQ_FLOOR))
+    alpha = EQ_ALPHA[:len(amp)]
+    a0 = 1 + alpha / amp
+
+    # All bands at once, one row of [b0, b1, b2, a0, a1, a2] per band
+    sos = np.empty((len(amp), 6), dtype=np.float32)
+    sos[:, 0] = (1 + alpha * amp) / a0
+    sos[:, 1] = -2 * EQ_COS_W0[:len(amp)] / a0
+    sos[:, 2] = (1 - alpha * amp) / a0
+    sos[:, 3] = 1.0
+    sos[:, 4] = sos[:, 1]
+    sos[:, 5] = (1 - alpha / amp) / a0
+    return sos
 
 def apply_eq(samples, eq_values):
-    """Apply a simple EQ by scaling different frequency bands."""
-    samples_fft = np.fft.rfft(samples)
-    freqs = np.fft.rfftfreq(len(samples), d=1/SAMPLE_RATE)
-
-    band_limits = np.linspace(0, np.max(freqs), len(eq_values) + 1)
-
-    for i in range(len(eq_values)):
-        band = (freqs >= band_limits[i]) & (freqs < band_limits[i+1])
-        samples_fft[band] *= eq_values[i]
-
-    samples_eq = np.fft.irfft(samples_fft)
-    return samples_eq
-
-def generate_pygame_tone(frequency1=440, frequency2=660, duration_ms=500, volume_db=-10.0, distortion_amount=0.0, eq=None, left_vol=0.5, right_vol=0.5):
-    t = np.arange(SAMPLE_RATE * duration_ms / 1000.0) / SAMPLE_RATE
-    samples1 = np.sin(2 * np.pi * frequency1 * t)
-    samples2 = np.sin(2 * np.pi * frequency2 * t)
-    samples = (samples1 + samples2) / 2
+    """Apply a simple EQ by scaling each frequency band with a peaking filter."""
+    sos = eq_sos(tuple(round(v, 2) for v in eq_values))
+    return signal.sosfilt(sos, samples)
+
+def phase_step(frequency):
+    """Fixed-point phase increment per sample for a SINE_LUT oscillator."""
+    return int(round(frequency * (1 << PHASE_BITS) / SAMPLE_RATE))
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _two_osc(mono, step1, step2, lut):
+    """Mix two linearly interpolated wavetable oscillators into mono in a single pass."""
+    shift = PHASE_BITS - SINE_TABLE_BITS
+    phase_mask = (1 << PHASE_BITS) - 1
+    frac_mask = (1 << shift) - 1
+    frac_scale = 1.0 / (1 << shift)
+    for i in prange(mono.shape[0]):
+        p1 = (i * step1) & phase_mask
+        p2 = (i * step2) & phase_mask
+        i1 = p1 >> shift
+        i2 = p2 >> shift
+        f1 = (p1 & frac_mask) * frac_scale
+        f2 = (p2 & frac_mask) * frac_scale
+        s1 = lut[i1] + (lut[i1 + 1] - lut[i1]) * f1
+        s2 = lut[i2] + (lut[i2 + 1] - lut[i2]) * f2
+        mono[i] = 0.5 * (s1 + s2)
+
+def synthesize_mono(frequency1=440, frequency2=660, duration_ms=500, distortion_amount=0.0, eq=None):
+    """Mix both oscillators, then EQ and distort them into a float32 mono buffer."""
+    num_samples = int(SAMPLE_RATE * duration_ms / 1000.0)
+    samples = np.empty(num_samples, dtype=np.float32)
+    _two_osc(samples, phase_step(frequency1), phase_step(frequency2), SINE_LUT)
 
     if eq is not None:
         samples = apply_eq(samples, eq)
 
     if distortion_amount > 0.0:
         gain = 1 + distortion_amount * 10
-        samples = samples * gain
-        samples = np.tanh(samples)
-
-    samples = samples * (2**15 - 1)
-    samples = np.clip(samples, -32768, 32767)
-
-    left = np.int16(samples * left_vol)
-    right = np.int16(samples * right_vol)
-    stereo_samples = np.column_stack((left, right))
-
-    sound = pygame.sndarray.make_sound(stereo_samples)
-    sound.set_volume(10 ** (volume_db / 20))
-    return sound
+        np.multiply(samples, gain, out=samples)
+        np.tanh(samples, out=samples)
+
+    return samples
+
+def render_stereo(mono, left_vol=0.5, right_vol=0.5, volume_db=-10.0):
+    """Pan a float32 mono buffer into a new int16 stereo array with the volume applied."""
+    gain = 10 ** (volume_db / 20)
+    stereo_samples = np.empty((len(mono), 2), dtype=np.int16)
+    _finalize(mono, left_vol * gain, right_vol * gain, stereo_samples)
+    return stereo_samples
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _finalize(mono, left_vol, right_vol, out):
+    """Scale, clip and pan mono samples into int16 stereo in a single pass."""
+    for i in prange(mono.shape[0]):
+        x = min(max(mono[i] * 32767.0, -32768.0), 32767.0)
+        out[i, 0] = np.int16(x * left_vol)
+        out[i, 1] = np.int16(x * right_vol)
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _envelope_kernel(env, a_n, d_n, s_lvl, r_n):
+    """Fill env with the squared ADSR envelope."""
+    total = env.shape[0]
+    s_n = max(total - (a_n + d_n + r_n), 0)
+    for i in prange(total):
+        # Same segments as the squared np.linspace ramps in the original envelope
+        if i < a_n:
+            level = i / (a_n - 1) if a_n > 1 else 0.0
+        elif i < a_n + d_n:
+            level = 1.0 + (s_lvl - 1.0) * (i - a_n) / (d_n - 1) if d_n > 1 else 1.0
+        elif i < a_n + d_n + s_n:
+            level = s_lvl
+        else:
+            level = s_lvl - s_lvl * (i - a_n - d_n - s_n) / (r_n - 1) if r_n > 1 else s_lvl
+        env[i] = level * level
+
+@functools.lru_cache(maxsize=64)
+def build_envelope(a_n, d_n, s_lvl, r_n, total):
+    """Return a cached, read-only float32 ADSR envelope of total samples."""
+    env = np.empty(total, dtype=np.float32)
+    _envelope_kernel(env, a_n, d_n, s_lvl, r_n)
+    env.flags.writeable = False
+    return env
+
+# Use the ahead-of-time compiled kernels when they've been built (see setup.py)
+try:
+    import _synth
+except ImportError:
+    _synth = None
+if _synth is not None and _synth.PHASE_BITS == PHASE_BITS:
+    _two_osc, _finalize, _envelope_kernel = _synth._two_osc, _synth._finalize, _synth._envelope_kernel
+
+def warm_up_kernels():
+    """Compile the numba kernels up front so the first note isn't delayed."""
+    mono = np.empty(4, dtype=np.float32)
+    _two_osc(mono, phase_step(440), phase_step(660), SINE_LUT)
+    _envelope_kernel(mono, 1, 1, 0.5, 1)
+    _finalize(mono, 0.5, 0.5, np.empty((4, 2), dtype=np.int16))
 
 def check_sound_system():
     try:
@@ -74,14 +179,30 @@ class MusicSynthesizerApp:
         self.voices = []
         self.tempo = tk.IntVar(value=120)
         self.running = False
-        self.mute_var = tk.BooleanVar(value=False)
+        self._rendered = [None] * NUM_VOICES
+        self._dirty = [False] * NUM_VOICES
+        self._render_after = [None] * NUM_VOICES
+        self._render_event = threading.Event()
+        self._render_lock = threading.Lock()
+        # Mirrors of the Tk variables, kept current by traces
+        self.voice_state = np.zeros(NUM_VOICES, dtype=VOICE_DTYPE)
+        self._transport = {}
+        self.step_active = np.zeros((NUM_VOICES, STEP_COUNT), dtype=np.uint8)
+        self.voice_mute = np.zeros(NUM_VOICES, dtype=bool)
+        self.voice_loop = self.voice_state["Loop"]  # a view, updated with voice_state
+        self._voice_rows = np.arange(NUM_VOICES)
 
         if not check_sound_system():
             self.root.quit()
             return
+        warm_up_kernels()
+
+        # Every voice is mixed into the sequencer's output, which plays on channel 0
+        self._sequencer_channel = pygame.mixer.Channel(0)
 
         self.create_ui()
         self.sequencer_thread = None
+        self.render_thread = None
 
     def create_ui(self):
         top = tk.Frame(self.root)
@@ -89,6 +210,7 @@ class MusicSynthesizerApp:
 
         tk.Label(top, text="Tempo (BPM)").pack(side=tk.LEFT)
         tk.Scale(top, from_=60, to=240, variable=self.tempo, orient=tk.HORIZONTAL).pack(side=tk.LEFT)
+        self._mirror(self.tempo, self._transport, "tempo")
 
         btn_frame = tk.Frame(self.root)
         btn_frame.pack(pady=5)
@@ -111,6 +233,8 @@ class MusicSynthesizerApp:
         self.create_sequencer()
 
     def create_voice_controls(self, parent):
+        index = len(self.voices)
+        state = self.voice_state[index]
         sliders = {}
         labels = ["A", "D", "S", "R", "P1", "P2", "V", "G", "Loop"]
 
@@ -127,8 +251,11 @@ class MusicSynthesizerApp:
             slider = tk.Scale(parent, variable=var, from_=0.0, to=max_val, resolution=res, orient=tk.VERTICAL)
             slider.grid(row=1, column=i)
             sliders[label] = var
+            self._mirror(var, state, label, voice=index)
 
         eq = [tk.DoubleVar(value=0.5) for _ in range(NUM_BANDS)]
+        for j in range(NUM_BANDS):
+            self._mirror(eq[j], state["eq"], j, voice=index)
         for j in range(NUM_BANDS):
             tk.Label(parent, text=f"EQ{j+1}").grid(row=2, column=j)
             tk.Scale(parent, variable=eq[j], from_=0.0, to=1.0, resolution=0.01, orient=tk.VERTICAL).grid(row=3, column=j)
@@ -146,33 +273,61 @@ class MusicSynthesizerApp:
         tk.Scale(parent, variable=left_volume, from_=0.0, to=1.0, resolution=0.01, orient=tk.VERTICAL).grid(row=3, column=NUM_BANDS + 1)
         tk.Scale(parent, variable=right_volume, from_=0.0, to=1.0, resolution=0.01, orient=tk.VERTICAL).grid(row=3, column=NUM_BANDS + 2)
 
+        self._mirror(distortion, state, "distortion", voice=index)
+        self._mirror(left_volume, state, "left_vol", voice=index)
+        self._mirror(right_volume, state, "right_vol", voice=index)
+
         self.voices.append({
             "params": sliders,
             "eq": eq,
             "left_vol": left_volume,
             "right_vol": right_volume,
-            "distortion": distortion,
-            "mute": self.mute_var   # <-- add this
+            "distortion": distortion
         })
 
+    def _mirror(self, var, target, key, voice=None):
+        """Keep target[key] in step with a Tk variable so other threads never call .get().
+
+        With voice set, every change also schedules that voice for a re-render.
+        """
+        def update(*args):
+            target[key] = var.get()
+            if args and voice is not None:
+                self._schedule_render(voice)
+        var.trace_add("write", update)
+        update()
+
+    def _schedule_render(self, instrument_index):
+        # Restart the timer on each change so a drag re-renders once, after it settles
+        pending = self._render_after[instrument_index]
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._render_after[instrument_index] = self.root.after(
+            RENDER_DEBOUNCE_MS, self._render_settled, instrument_index)
+
+    def _render_settled(self, instrument_index):
+        self._render_after[instrument_index] = None
+        self.mark_dirty(instrument_index)
+
     def save_pattern(self):
         file_path = filedialog.asksaveasfilename(defaultextension=".json",
                                                 filetypes=[("JSON files", "*.json")])
         if not file_path:
             return
 
+        # Serialize from the mirrors rather than calling .get() on every variable
         data = {
-            "sequence": [[var.get() for var in row] for row in self.sequence],
+            "sequence": [[bool(mute)] + row.tolist() for mute, row in zip(self.voice_mute, self.step_active)],
             "voices": []
         }
 
-        for voice in self.voices:
+        for voice, state in zip(self.voices, self.voice_state):
             voice_data = {
-                "params": {k: v.get() for k, v in voice["params"].items()},
-                "eq": [eqv.get() for eqv in voice["eq"]],
-                "left_vol": voice["left_vol"].get(),
-                "right_vol": voice["right_vol"].get(),
-                "distortion": voice["distortion"].get()
+                "params": {k: float(state[k]) for k in voice["params"]},
+                "eq": state["eq"].tolist(),
+                "left_vol": float(state["left_vol"]),
+                "right_vol": float(state["right_vol"]),
+                "distortion": float(state["distortion"])
             }
             data["voices"].append(voice_data)
 
@@ -205,6 +360,10 @@ class MusicSynthesizerApp:
                 self.voices[i]["right_vol"].set(voice_data["right_vol"])
                 self.voices[i]["distortion"].set(voice_data["distortion"])
 
+        self._render_samples.cache_clear()
+        for i in range(len(self.voices)):
+            self.mark_dirty(i)
+
     def create_sequencer(self):
         self.sequence = []
         for i in range(NUM_VOICES):
@@ -214,6 +373,7 @@ class MusicSynthesizerApp:
             mute_button = tk.Checkbutton(self.seq_frame, text="Mute", variable=mute_var)
             mute_button.grid(row=i, column=0)  # Place mute button at column 0
             row.append(mute_var)  # Store mute_var, not the button itself
+            self._mirror(mute_var, self.voice_mute, i)
             
             # Create step buttons
             for j in range(STEP_COUNT):
@@ -221,108 +381,149 @@ class MusicSynthesizerApp:
                 cb = tk.Checkbutton(self.seq_frame, variable=var)
                 cb.grid(row=i, column=j+1)  # Shift steps by +1 to make room for mute
                 row.append(var)
+                self._mirror(var, self.step_active[i], j)
             
             self.sequence.append(row)
 
 
     def start_sequencer(self):
         if not self.running:
+            # A quick Stop -> Play can catch the last run still queueing its
+            # tail; let it finish so only one thread ever feeds the channel
+            for thread in (self.sequencer_thread, self.render_thread):
+                if thread is not None:
+                    thread.join()
             self.running = True
+            for i in range(len(self.voices)):
+                self._render_voice(i)
+            self.render_thread = threading.Thread(target=self.run_renderer, daemon=True)
+            self.render_thread.start()
             self.sequencer_thread = threading.Thread(target=self.run_sequence, daemon=True)
             self.sequencer_thread.start()
 
     def stop_sequencer(self):
         self.running = False
+        self._render_event.set()  # wake the renderer so it can exit
+        self._render_samples.cache_clear()
 
     def run_sequence(self):
+        # Notes are summed into a mix-ahead buffer and handed to one channel a
+        # step at a time, so the audio device's clock sets the timing and this
+        # thread only has to keep the channel's queue slot filled
+        mix = np.zeros((MIX_AHEAD, 2), dtype=np.int32)
+        chunk_buffer = np.empty((MIX_AHEAD, 2), dtype=np.int16)
+        channel = self._sequencer_channel
         global_step = 0
+        step_end = 0.0
+        emitted = 0
         while self.running:
-            interval = 60 / self.tempo.get() / 4
-            for i, voice in enumerate(self.voices):
-                voice_loop = int(voice["params"]["Loop"].get())
-                step_index = global_step % voice_loop
-                if self.sequence[i][0].get() == True:
-                    continue
-                # Check if the voice is muted before proceeding with step
-                if step_index < STEP_COUNT and self.sequence[i][step_index].get():
-                    self.play_voice(i)
+            # Look up every voice's current step at once. Position p plays step
+            # button p - 1 and position 0 rests, as in the original layout where
+            # column 0 of each sequencer row held the mute box
+            button = global_step % self.voice_loop - 1
+            in_range = (button >= 0) & (button < STEP_COUNT)
+            triggers = self.step_active[self._voice_rows, np.where(in_range, button, 0)]
+            triggers &= in_range & ~self.voice_mute
+            for i in np.flatnonzero(triggers):
+                samples = self._rendered[i]
+                n = min(len(samples), MIX_AHEAD)
+                mix[:n] += samples[:n]
+
+            # Carry the fractional part so the tempo doesn't drift
+            step_end += SAMPLE_RATE * 60 / self._transport["tempo"] / 4
+            step_samples = int(step_end) - emitted
+            emitted += step_samples
+            self._queue_chunk(channel, mix[:step_samples], chunk_buffer)
+            mix[:-step_samples] = mix[step_samples:]
+            mix[-step_samples:] = 0
 
             global_step += 1
-            time.sleep(interval)
+
+        # Let notes that are still ringing finish
+        ringing = np.flatnonzero(mix.any(axis=1))
+        if len(ringing):
+            self._queue_chunk(channel, mix[:ringing[-1] + 1], chunk_buffer)
+
+    def _queue_chunk(self, channel, chunk, chunk_buffer):
+        # Clip straight into the int16 buffer; make_sound copies it out
+        out = chunk_buffer[:len(chunk)]
+        np.clip(chunk, -32768, 32767, out=out, casting="unsafe")
+        sound = pygame.sndarray.make_sound(out)
+        if not channel.get_busy():
+            channel.play(sound)
+            return
+        # Only one sound can wait in a channel's queue; wait for it to start
+        while channel.get_queue() is not None:
+            time.sleep(0.002)
+        channel.queue(sound)
+
+    def mark_dirty(self, instrument_index):
+        self._dirty[instrument_index] = True
+        self._render_event.set()
+
+    def run_renderer(self):
+        while self.running:
+            self._render_event.wait()
+            self._render_event.clear()
+            for i, dirty in enumerate(self._dirty):
+                if dirty and self.running:
+                    self._render_voice(i)
+
+    def _render_voice(self, instrument_index):
+        with self._render_lock:
+            self._dirty[instrument_index] = False
+            samples = self._render_samples(self.snapshot_voice(self.voice_state[instrument_index]))
+            self._rendered[instrument_index] = samples
+        return samples
 
     def apply_adsr(self, samples, attack, decay, sustain, release, duration_sec, sample_rate):
-        total_samples = samples.shape[0]
-        
         # Calculate ADSR section lengths
         attack_samples = int(sample_rate * attack)
         decay_samples = int(sample_rate * decay)
         release_samples = int(sample_rate * release)
-        sustain_samples = max(total_samples - (attack_samples + decay_samples + release_samples), 0)
-
-        # Build the envelope parts
-        attack_curve = np.linspace(0, 1, attack_samples) ** 2  # <-- Smoother attack (exponential curve)
-        decay_curve = np.linspace(1, sustain, decay_samples) ** 2  # <-- Smoother decay
-        sustain_curve = np.ones(sustain_samples) * (sustain ** 2)  # <-- Flattened sustain
-        release_curve = (np.linspace(sustain, 0, release_samples) ** 2)  # <-- Smooth release
 
-        # Concatenate all parts
-        envelope = np.concatenate((attack_curve, decay_curve, sustain_curve, release_curve))
+        sustain_level = round(sustain * 256) / 256
 
-        # Make sure envelope matches samples length exactly
-        if len(envelope) < total_samples:
-            envelope = np.pad(envelope, (0, total_samples - len(envelope)))
-        else:
-            envelope = envelope[:total_samples]
-
-        # Apply envelope to both stereo channels
-        samples = samples * envelope[:, np.newaxis]
+        # Apply the squared envelope to the mono buffer in place
+        envelope = build_envelope(attack_samples, decay_samples, sustain_level, release_samples, len(samples))
+        np.multiply(samples, envelope, out=samples)
 
         return samples
 
 
-# After applying ADSR:
-    def play_voice(self, instrument_index):
-        if instrument_index >= len(self.voices):
-            return
-        voice = self.voices[instrument_index]
-
-        if voice["mute"].get():  # Skip playing if the voice is muted
-            return
-        
-        params = voice["params"]
-
-        freq1 = params["P1"].get()
-        freq2 = params["P2"].get()
-        vol = params["V"].get()
-        gain = params["G"].get()
+    def snapshot_voice(self, state):
+        """Turn a voice's state record into a quantized tuple usable as a cache key."""
+        snap = dict(zip(VOICE_DTYPE.names, state.item()))
         duration_ms = 500
-
-        total_volume_db = -40 + (vol + gain) * 20
-        eq_values = [eq.get() for eq in voice["eq"]]
-        distortion = voice["distortion"].get()
-        left_vol = voice["left_vol"].get()
-        right_vol = voice["right_vol"].get()
-
-        # Get ADSR parameters from voice controls
-        attack = params["A"].get()  # Attack
-        decay = params["D"].get()   # Decay
-        sustain = params["S"].get()  # Sustain
-        release = params["R"].get() # Release
-
-        # Generate tone and apply ADSR envelope
-        tone = generate_pygame_tone(freq1, freq2, duration_ms, total_volume_db,
-                                    distortion_amount=distortion, eq=eq_values,
-                                    left_vol=left_vol, right_vol=right_vol)
-        
-        # Apply ADSR envelope
-        samples = pygame.sndarray.array(tone)
-        samples = np.copy(samples)  # Ensure the samples are a numpy array
+        total_volume_db = -40 + (snap["V"] + snap["G"]) * 20
+        return (
+            round(snap["P1"], 1),
+            round(snap["P2"], 1),
+            duration_ms,
+            round(total_volume_db, 2),
+            tuple(round(eq, 2) for eq in snap["eq"].tolist()),
+            round(snap["distortion"], 2),
+            round(snap["left_vol"], 2),
+            round(snap["right_vol"], 2),
+            round(snap["A"], 3),
+            round(snap["D"], 3),
+            round(snap["S"], 3),
+            round(snap["R"], 3),
+        )
+
+    @functools.lru_cache(maxsize=256)
+    def _render_samples(self, key):
+        (freq1, freq2, duration_ms, total_volume_db, eq_values, distortion,
+         left_vol, right_vol, attack, decay, sustain, release) = key
+
+        # Generate the mono tone and apply the ADSR envelope before panning
+        samples = synthesize_mono(freq1, freq2, duration_ms, distortion, list(eq_values))
         samples = self.apply_adsr(samples, attack, decay, sustain, release, duration_ms / 1000.0, SAMPLE_RATE)
 
-        samples = np.array(samples, dtype=np.int32)
-        # Convert the processed samples to sound and play them
-        sound = pygame.sndarray.make_sound(samples)
-        sound.play()
+        # Convert the processed samples to int16 stereo for the sequencer to mix
+        stereo_samples = render_stereo(samples, left_vol, right_vol, total_volume_db)
+        stereo_samples.flags.writeable = False
+        return stereo_samples
 
 
 if __name__ == "__main__":
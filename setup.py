@@ -0,0 +1,50 @@
+import os
+import tempfile
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CompileError, LinkError
+
+# Optional compiled kernels for sauce.py: python setup.py build_ext --inplace
+
+OPENMP_PROBE = """#include <omp.h>
+int main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }
+"""
+
+
+class BuildExt(build_ext):
+    """Build with OpenMP where the compiler supports it, and serially where it doesn't."""
+
+    def build_extensions(self):
+        if self.compiler.compiler_type == "msvc":
+            compile_args, link_args = ["/O2", "/openmp"], []
+        elif self._has_openmp():
+            compile_args, link_args = ["-O3", "-fopenmp"], ["-fopenmp"]
+        else:
+            # e.g. Apple clang; prange then runs as a plain loop
+            print("OpenMP not available, building _synth without it")
+            compile_args, link_args = ["-O3"], []
+        for ext in self.extensions:
+            ext.extra_compile_args = compile_args
+            ext.extra_link_args = link_args
+        super().build_extensions()
+
+    def _has_openmp(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "omp_probe.c")
+            with open(source, "w") as f:
+                f.write(OPENMP_PROBE)
+            try:
+                objects = self.compiler.compile([source], output_dir=tmp, extra_postargs=["-fopenmp"])
+                self.compiler.link_executable(objects, "omp_probe", output_dir=tmp, extra_postargs=["-fopenmp"])
+            except (CompileError, LinkError):
+                return False
+        return True
+
+
+setup(
+    name="sauce-synth",
+    ext_modules=cythonize([Extension("_synth", ["_synth.pyx"])]),
+    cmdclass={"build_ext": BuildExt},
+)